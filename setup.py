@@ -3,9 +3,13 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+about = {}
+with open("simple_vcs/__init__.py", "r", encoding="utf-8") as fh:
+    exec(fh.read(), about)
+
 setup(
     name="simple-vcs",
-    version="1.3.0",
+    version=about["__version__"],
     author="Muhammad Sufiyan Baig",
     author_email="send.sufiyan@gmail.com",
     description="A beautiful and simple version control system with a stunning terminal interface",
@@ -13,6 +17,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/muhammadsufiyanbaig/simple_vcs",
     packages=find_packages(),
+    package_data={"simple_vcs": ["_help.ansi"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -31,6 +36,9 @@ setup(
         "click>=7.0",
         "rich>=10.0.0",
     ],
+    extras_require={
+        "fast": ["blake3>=0.4", "orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "svcs=simple_vcs.cli:main",
@@ -2,9 +2,16 @@
 SimpleVCS - A simple version control system
 """
 
-__version__ = "1.1.0"
+__version__ = "1.3.0"
 __author__ = "Muhammad Sufiyan Baig"
 
-from .core import SimpleVCS
-
 __all__ = ["SimpleVCS"]
+
+
+def __getattr__(name):
+    # Import core (and with it rich) only when SimpleVCS is actually used,
+    # so `import simple_vcs.cli` stays cheap for `svcs --help`/`--version`.
+    if name == "SimpleVCS":
+        from .core import SimpleVCS
+        return SimpleVCS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
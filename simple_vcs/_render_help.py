@@ -0,0 +1,94 @@
+"""
+Rich rendering of the top-level `svcs --help` screen.
+
+The help screen never changes at runtime, so a copy rendered at HELP_WIDTH
+columns is shipped as _help.ansi and written out directly by the CLI.
+Regenerate it after changing this module or bumping the version:
+
+    python -m simple_vcs._render_help > simple_vcs/_help.ansi
+"""
+
+import sys
+
+from . import __version__
+
+HELP_WIDTH = 80
+
+
+def render_help(console):
+    """Print the SimpleVCS help screen to the given Rich console"""
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+
+    # Beautiful header
+    console.print()
+    title = Text("SimpleVCS", style="bold cyan", justify="center")
+    subtitle = Text("A Beautiful Version Control System", style="dim", justify="center")
+    console.print(title)
+    console.print(subtitle)
+    console.print()
+
+    # Description panel
+    description = Panel(
+        "[white]A lightweight, elegant version control system with a modern terminal interface.\n"
+        "Track your files, manage versions, and keep your project history organized.[/white]",
+        title="[bold cyan]About[/bold cyan]",
+        border_style="cyan",
+        box=box.ROUNDED,
+        padding=(0, 2)
+    )
+    console.print(description)
+    console.print()
+
+    # Commands section
+    console.print("[bold white]Available Commands:[/bold white]")
+    console.print()
+
+    commands_info = [
+        ("init", "Initialize a new repository", "cyan"),
+        ("add", "Add files to staging area", "green"),
+        ("commit", "Create a new commit", "green"),
+        ("status", "Show repository status", "yellow"),
+        ("log", "View commit history", "blue"),
+        ("diff", "Compare commits", "magenta"),
+        ("revert", "Revert to previous commit", "red"),
+        ("snapshot", "Create backup snapshot", "cyan"),
+        ("restore", "Restore from snapshot", "cyan"),
+        ("compress", "Optimize storage", "yellow"),
+    ]
+
+    for cmd_name, cmd_desc, color in commands_info:
+        console.print(f"  [{color}]{cmd_name:12}[/{color}] [dim]{cmd_desc}[/dim]")
+
+    console.print()
+
+    # Usage examples
+    examples = Panel(
+        "[bold]Quick Start:[/bold]\n"
+        "[cyan]$[/cyan] svcs init                    [dim]# Create repository[/dim]\n"
+        "[cyan]$[/cyan] svcs add file.txt            [dim]# Stage files[/dim]\n"
+        "[cyan]$[/cyan] svcs commit -m \"message\"     [dim]# Save changes[/dim]\n"
+        "[cyan]$[/cyan] svcs log                     [dim]# View history[/dim]\n"
+        "[cyan]$[/cyan] svcs -q add *.py             [dim]# Stage without output[/dim]\n\n"
+        "[bold]Get Help:[/bold]\n"
+        "[cyan]$[/cyan] svcs [yellow]<command>[/yellow] --help       [dim]# Help for specific command[/dim]",
+        title="[bold green]Examples[/bold green]",
+        border_style="green",
+        box=box.ROUNDED,
+        padding=(0, 2)
+    )
+    console.print(examples)
+    console.print()
+
+    # Footer
+    console.print(
+        f"[dim]Version {__version__}  |  "
+        "More info: [/dim][cyan]https://github.com/muhammadsufiyanbaig/simple_vcs[/cyan]"
+    )
+    console.print()
+
+
+if __name__ == '__main__':
+    from rich.console import Console
+    render_help(Console(file=sys.stdout, width=HELP_WIDTH, force_terminal=True, color_system="standard"))
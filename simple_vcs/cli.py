@@ -1,123 +1,94 @@
+import inspect
+import os
+import shutil
+import sys
+from pathlib import Path
+
 import click
-from .core import SimpleVCS
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from rich.columns import Columns
 
-console = Console()
+from . import __version__
+from ._render_help import HELP_WIDTH
+
+_PRERENDERED_HELP = Path(__file__).with_name("_help.ansi")
+
+def _can_use_prerendered_help() -> bool:
+    """Check whether the pre-rendered help displays correctly on stdout"""
+    if sys.platform == "win32" or "NO_COLOR" in os.environ or not sys.stdout.isatty():
+        return False
+    if (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
+        return False
+    if shutil.get_terminal_size().columns < HELP_WIDTH:
+        return False
+    return _PRERENDERED_HELP.exists()
 
 class RichGroup(click.Group):
-    """Custom Click Group that adds Rich formatting to help output"""
+    """Custom Click Group that adds Rich formatting to help output and builds subcommands lazily"""
+
+    def list_commands(self, ctx):
+        """List all available subcommand names"""
+        return sorted(_COMMAND_SPECS)
+
+    def get_command(self, ctx, cmd_name):
+        """Build the requested subcommand on first use"""
+        if cmd_name not in self.commands and cmd_name in _COMMAND_SPECS:
+            self.add_command(_build_command(cmd_name))
+        return self.commands.get(cmd_name)
+
+    def main(self, *args, **kwargs):
+        """Run the CLI, under cProfile when SVCS_PROFILE is set"""
+        if not os.environ.get("SVCS_PROFILE"):
+            return super().main(*args, **kwargs)
+
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(super().main, *args, **kwargs)
+        finally:
+            profiler.dump_stats(os.environ.get("SVCS_PROFILE_OUT", "svcs.prof"))
 
     def format_help(self, ctx, formatter):
         """Override help formatting with Rich output"""
-        console = Console()
-
-        # Beautiful header
-        console.print()
-        title = Text("SimpleVCS", style="bold cyan", justify="center")
-        subtitle = Text("A Beautiful Version Control System", style="dim", justify="center")
-        console.print(title)
-        console.print(subtitle)
-        console.print()
-
-        # Description panel
-        description = Panel(
-            "[white]A lightweight, elegant version control system with a modern terminal interface.\n"
-            "Track your files, manage versions, and keep your project history organized.[/white]",
-            title="[bold cyan]About[/bold cyan]",
-            border_style="cyan",
-            box=box.ROUNDED,
-            padding=(0, 2)
-        )
-        console.print(description)
-        console.print()
-
-        # Commands section
-        console.print("[bold white]Available Commands:[/bold white]")
-        console.print()
-
-        commands_info = [
-            ("init", "Initialize a new repository", "cyan"),
-            ("add", "Add files to staging area", "green"),
-            ("commit", "Create a new commit", "green"),
-            ("status", "Show repository status", "yellow"),
-            ("log", "View commit history", "blue"),
-            ("diff", "Compare commits", "magenta"),
-            ("revert", "Revert to previous commit", "red"),
-            ("snapshot", "Create backup snapshot", "cyan"),
-            ("restore", "Restore from snapshot", "cyan"),
-            ("compress", "Optimize storage", "yellow"),
-        ]
-
-        for cmd_name, cmd_desc, color in commands_info:
-            console.print(f"  [{color}]{cmd_name:12}[/{color}] [dim]{cmd_desc}[/dim]")
-
-        console.print()
-
-        # Usage examples
-        examples = Panel(
-            "[bold]Quick Start:[/bold]\n"
-            "[cyan]$[/cyan] svcs init                    [dim]# Create repository[/dim]\n"
-            "[cyan]$[/cyan] svcs add file.txt            [dim]# Stage files[/dim]\n"
-            "[cyan]$[/cyan] svcs commit -m \"message\"     [dim]# Save changes[/dim]\n"
-            "[cyan]$[/cyan] svcs log                     [dim]# View history[/dim]\n\n"
-            "[bold]Get Help:[/bold]\n"
-            "[cyan]$[/cyan] svcs [yellow]<command>[/yellow] --help       [dim]# Help for specific command[/dim]",
-            title="[bold green]Examples[/bold green]",
-            border_style="green",
-            box=box.ROUNDED,
-            padding=(0, 2)
-        )
-        console.print(examples)
-        console.print()
-
-        # Footer
-        console.print(
-            "[dim]Version 1.2.0  |  "
-            "More info: [/dim][cyan]https://github.com/muhammadsufiyanbaig/simple_vcs[/cyan]"
-        )
-        console.print()
-
-        # Prevent Click from outputting its own help
-        ctx.resilient_parsing = True
+        if _can_use_prerendered_help():
+            sys.stdout.write(_PRERENDERED_HELP.read_text(encoding="utf-8"))
+            return
+
+        from rich.console import Console
+        from ._render_help import render_help
+        render_help(Console())
 
 @click.group(cls=RichGroup)
-@click.version_option(version="1.3.0", prog_name="SimpleVCS")
-def main():
+@click.version_option(version=__version__, prog_name="SimpleVCS")
+@click.option('-q', '--quiet', is_flag=True, help='Only print errors and warnings when changing the repository')
+def main(quiet):
     """SimpleVCS - A beautiful and simple version control system"""
     pass
 
-@main.command()
-@click.option('--path', default='.', help='Path where repository will be created')
-def init(path):
+def _open_vcs(path="."):
+    """Create the SimpleVCS instance for the running command, honouring --quiet"""
+    from .core import SimpleVCS
+    return SimpleVCS(path, quiet=click.get_current_context().find_root().params.get("quiet", False))
+
+def _init(path):
     """Initialize a new SimpleVCS repository
 
     Creates a new .svcs directory with all necessary files for version control.
 
     Example: svcs init --path ./my-project
     """
-    vcs = SimpleVCS(path)
+    vcs = _open_vcs(path)
     vcs.init_repo()
 
-@main.command()
-@click.argument('files', nargs=-1, required=True)
-def add(files):
+def _add(files):
     """Add files to the staging area
 
     Stage files to be included in the next commit. You can add multiple files at once.
 
     Example: svcs add file1.txt file2.py
     """
-    vcs = SimpleVCS()
-    for file in files:
-        vcs.add_file(file)
+    vcs = _open_vcs()
+    vcs.add_files(files)
 
-@main.command()
-@click.option('-m', '--message', help='Commit message describing the changes')
-def commit(message):
+def _commit(message):
     """Commit staged changes to the repository
 
     Creates a new commit with all staged files. If no message is provided,
@@ -125,13 +96,10 @@ def commit(message):
 
     Example: svcs commit -m "Add new feature"
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.commit(message)
 
-@main.command()
-@click.option('--c1', type=int, help='First commit ID (defaults to second-last commit)')
-@click.option('--c2', type=int, help='Second commit ID (defaults to last commit)')
-def diff(c1, c2):
+def _diff(c1, c2):
     """Show differences between commits
 
     Compare files between two commits to see what changed. Without arguments,
@@ -139,12 +107,10 @@ def diff(c1, c2):
 
     Example: svcs diff --c1 1 --c2 3
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.show_diff(c1, c2)
 
-@main.command()
-@click.option('--limit', type=int, help='Maximum number of commits to display')
-def log(limit):
+def _log(limit):
     """Show commit history
 
     Display a beautiful table of all commits with their messages, dates, and files.
@@ -152,11 +118,10 @@ def log(limit):
 
     Example: svcs log --limit 10
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.show_log(limit)
 
-@main.command()
-def status():
+def _status():
     """Show current repository status
 
     Display information about the repository including current commit,
@@ -164,12 +129,10 @@ def status():
 
     Example: svcs status
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.status()
 
-@main.command()
-@click.argument('commit_id', type=int)
-def revert(commit_id):
+def _revert(commit_id):
     """Revert to a specific commit
 
     Quickly restore your repository to a previous commit state.
@@ -177,12 +140,10 @@ def revert(commit_id):
 
     Example: svcs revert 3
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.quick_revert(commit_id)
 
-@main.command()
-@click.option('--name', help='Custom name for the snapshot (optional)')
-def snapshot(name):
+def _snapshot(name):
     """Create a compressed snapshot
 
     Creates a ZIP archive of your entire repository (excluding .svcs directory).
@@ -190,12 +151,10 @@ def snapshot(name):
 
     Example: svcs snapshot --name my-backup
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.create_snapshot(name)
 
-@main.command()
-@click.argument('snapshot_path', type=click.Path(exists=True))
-def restore(snapshot_path):
+def _restore(snapshot_path):
     """Restore from a snapshot
 
     Restore your repository from a previously created snapshot ZIP file.
@@ -203,11 +162,10 @@ def restore(snapshot_path):
 
     Example: svcs restore snapshot_12345.zip
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.restore_from_snapshot(snapshot_path)
 
-@main.command()
-def compress():
+def _compress():
     """Compress stored objects
 
     Optimize repository storage by compressing object files.
@@ -215,8 +173,53 @@ def compress():
 
     Example: svcs compress
     """
-    vcs = SimpleVCS()
+    vcs = _open_vcs()
     vcs.compress_objects()
 
+# Command name -> (callback, parameter specs). Parameters are kept as plain
+# (class, declarations, attributes) tuples so no click Parameter or Command
+# objects are created until the command is actually looked up.
+_COMMAND_SPECS = {
+    "init": (_init, (
+        (click.Option, ['--path'], {'default': '.', 'help': 'Path where repository will be created'}),
+    )),
+    "add": (_add, (
+        (click.Argument, ['files'], {'nargs': -1, 'required': True}),
+    )),
+    "commit": (_commit, (
+        (click.Option, ['-m', '--message'], {'help': 'Commit message describing the changes'}),
+    )),
+    "diff": (_diff, (
+        (click.Option, ['--c1'], {'type': int, 'help': 'First commit ID (defaults to second-last commit)'}),
+        (click.Option, ['--c2'], {'type': int, 'help': 'Second commit ID (defaults to last commit)'}),
+    )),
+    "log": (_log, (
+        (click.Option, ['--limit'], {'type': int, 'help': 'Maximum number of commits to display'}),
+    )),
+    "status": (_status, ()),
+    "revert": (_revert, (
+        (click.Argument, ['commit_id'], {'type': int}),
+    )),
+    "snapshot": (_snapshot, (
+        (click.Option, ['--name'], {'help': 'Custom name for the snapshot (optional)'}),
+    )),
+    "restore": (_restore, (
+        (click.Argument, ['snapshot_path'], {'type': click.Path(exists=True)}),
+    )),
+    "compress": (_compress, ()),
+}
+
+def _build_command(name):
+    """Construct the click Command for a registered subcommand"""
+    callback, param_specs = _COMMAND_SPECS[name]
+    params = [cls(decls, **attrs) for cls, decls, attrs in param_specs]
+    return click.Command(name, callback=callback, params=params, help=inspect.getdoc(callback))
+
+def __getattr__(name):
+    # Keep `simple_vcs.cli.<command>` available now that commands are built lazily
+    if name in _COMMAND_SPECS:
+        return main.get_command(None, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,37 +1,165 @@
 import os
 import json
+import gzip
 import hashlib
+import mmap
 import shutil
 import time
 import sys
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import zipfile
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
 from rich import box
 from rich.text import Text
-from rich.columns import Columns
 from rich.tree import Tree
 from rich.align import Align
 
+try:
+    import blake3
+except ImportError:  # optional, installed with the "fast" extra
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "fast" extra
+    orjson = None
+
+# Files up to this size are hashed through a single mmap'd update;
+# larger ones are streamed in _HASH_CHUNK_SIZE pieces to bound memory use.
+_MMAP_HASH_LIMIT = 64 * 1024 * 1024
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_BLAKE3_PREFIX = "b3_"
+
+# Suffix of objects that compress_objects has gzipped
+_GZIP_SUFFIX = ".gz"
+
+# Extra records tolerated in the staging log before add_files compacts it
+_STAGING_COMPACT_SLACK = 32
+
+# Commits record only the files that changed since their parent. A commit
+# also records its full tree when it is _TREE_INTERVAL deltas away from the
+# nearest ancestor with one, so rebuilding any commit's tree replays fewer
+# than that many deltas.
+_TREE_INTERVAL = 32
+
+# Seconds after a modification during which a file's stat data is not
+# trusted by the stat cache (git's "racily clean" entries)
+_RACY_WINDOW = 1.0
+
+# Worker threads used for per-object work (hashing, storing, compressing)
+_WORKER_THREADS = min(32, (os.cpu_count() or 1) * 2)
+
+def _fold_staging(records: List[Dict]) -> Dict:
+    """Collapse staging log records into {path: info}, last record winning"""
+    staging = {}
+    for record in records:
+        info = dict(record)
+        staging[info.pop("path")] = info
+    return staging
+
+# Per-thread read buffers reused by _iter_chunks
+_thread_buffers = threading.local()
+
+def _create_temp(directory: Path) -> Tuple[int, str]:
+    """Create a new temporary file in a directory, returning its descriptor and path"""
+    # Unlike mkstemp's 0600, mode 0666 lets the umask decide, as a plain open()
+    # would, so objects stay readable in group-shared repositories
+    tmp_name = os.path.join(directory, ".tmp_" + os.urandom(8).hex())
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    return os.open(tmp_name, flags, 0o666), tmp_name
+
+def _iter_chunks(f):
+    """Yield a binary file's content as views into a reused per-thread buffer"""
+    # Each chunk is only valid until the next one is read
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None:
+        buf = _thread_buffers.buf = memoryview(bytearray(_HASH_CHUNK_SIZE))
+    n = f.readinto(buf)
+    while n:
+        yield buf[:n]
+        n = f.readinto(buf)
+
+def _format_size(size: int) -> str:
+    """Format a byte count for display, in KB below 1 MB and in MB above"""
+    if -(1 << 20) < size < (1 << 20):
+        return f"{size / 1024:.1f}KB"
+    return f"{size / (1 << 20):.1f}MB"
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp as local 'YYYY-MM-DD HH:MM:SS'"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+def _new_hasher(algorithm: str):
+    """Return a fresh hasher for an algorithm and the prefix for its object names"""
+    if algorithm == "blake3":
+        return blake3.blake3(max_threads=blake3.blake3.AUTO), _BLAKE3_PREFIX
+    return hashlib.sha256(), ""
+
+def _hash_algorithm_of(obj_hash: str) -> str:
+    """Return the algorithm an object hash was computed with"""
+    return "blake3" if obj_hash.startswith(_BLAKE3_PREFIX) else "sha256"
+
+def _copy_file(src: Path, dst: Path):
+    """Copy a file's content, letting the kernel clone or copy it when it can"""
+    if hasattr(os, "copy_file_range"):  # Linux, Python 3.8+
+        try:
+            with open(src, 'rb') as f_in, open(dst, 'wb') as f_out:
+                remaining = os.fstat(f_in.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(f_in.fileno(), f_out.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return  # a short copy falls back to copyfile below
+        except OSError:
+            pass  # e.g. unsupported or cross-device on older kernels
+    shutil.copyfile(src, dst)
+
+def _json_dumps(data) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class SimpleVCS:
     """Simple Version Control System core functionality"""
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", quiet: bool = False):
         self.repo_path = Path(repo_path).resolve()
         self.svcs_dir = self.repo_path / ".svcs"
         self.objects_dir = self.svcs_dir / "objects"
-        self.commits_file = self.svcs_dir / "commits.json"
-        self.staging_file = self.svcs_dir / "staging.json"
+        self.commits_file = self.svcs_dir / "commits.jsonl"
+        self.legacy_commits_file = self.svcs_dir / "commits.json"
+        self.staging_file = self.svcs_dir / "staging.jsonl"
+        self.legacy_staging_file = self.svcs_dir / "staging.json"
         self.head_file = self.svcs_dir / "HEAD"
+        self.config_file = self.svcs_dir / "config"
         # Force UTF-8 output and disable emoji on Windows
         self.is_windows = sys.platform == "win32"
         self.console = Console(force_terminal=True, legacy_windows=False)
+        self.quiet = quiet
+        self._print = (lambda *args, **kwargs: None) if quiet else self.console.print
+        # Parsed commit history, reused while the file's (mtime, size) is unchanged
+        self._commits_cache = None
+        self._commits_cache_key = None
+        self._commits_by_id = {}
+        self._parents = {}
+        self._children = {}
+        self._trees = {}
+        self._hash_algorithm = None
         
     def init_repo(self) -> bool:
         """Initialize a new repository"""
@@ -40,22 +168,28 @@ class SimpleVCS:
             return False
 
         # Print beautiful header
-        self.console.print()
-        header = Text("SimpleVCS", style="bold cyan", justify="center")
-        self.console.print(header)
-        self.console.print(Align.center("[dim]A Beautiful Version Control System[/dim]"))
-        self.console.print()
+        if not self.quiet:
+            self.console.print()
+            header = Text("SimpleVCS", style="bold cyan", justify="center")
+            self.console.print(header)
+            self.console.print(Align.center("[dim]A Beautiful Version Control System[/dim]"))
+            self.console.print()
 
-        self.console.print("[cyan]Initializing repository...[/cyan]")
+        self._print("[cyan]Initializing repository...[/cyan]")
 
         # Create directory structure
         self.svcs_dir.mkdir()
         self.objects_dir.mkdir()
 
         # Initialize files
-        self._write_json(self.commits_file, [])
-        self._write_json(self.staging_file, {})
+        self.commits_file.touch()
+        self.staging_file.touch()
         self.head_file.write_text("0")  # Start with commit 0
+        # Pin the hash algorithm so every install hashes this repository alike
+        self.config_file.write_bytes(_json_dumps({"hash": "blake3" if blake3 is not None else "sha256"}))
+
+        if self.quiet:
+            return True
 
         # Create tree structure visualization
         tree = Tree(
@@ -63,9 +197,10 @@ class SimpleVCS:
             guide_style="cyan"
         )
         tree.add("[green]objects/[/green] [dim]- Stores file content by hash[/dim]")
-        tree.add("[green]commits.json[/green] [dim]- Tracks all commits and history[/dim]")
-        tree.add("[green]staging.json[/green] [dim]- Lists files ready to commit[/dim]")
+        tree.add("[green]commits.jsonl[/green] [dim]- Tracks all commits and history[/dim]")
+        tree.add("[green]staging.jsonl[/green] [dim]- Lists files ready to commit[/dim]")
         tree.add("[green]HEAD[/green] [dim]- Points to current commit[/dim]")
+        tree.add("[green]config[/green] [dim]- Repository settings[/dim]")
 
         # Create success panel with tree
         panel_content = (
@@ -105,85 +240,169 @@ class SimpleVCS:
     
     def add_file(self, file_path: str) -> bool:
         """Add a file to staging area"""
+        return self.add_files([file_path])
+
+    def add_files(self, file_paths: List[str]) -> bool:
+        """Add several files to staging area, reading and writing the index once"""
         if not self._check_repo():
             return False
 
+        if self._get_hash_algorithm() == "blake3" and blake3 is None:
+            self.console.print("[red]ERROR: This repository hashes files with BLAKE3, which is not installed[/red]")
+            self.console.print("[dim]Tip: Run 'pip install simple-vcs\\[fast]' to install it[/dim]")
+            return False
+
+        records = self._read_staging_records()
+        staging = _fold_staging(records)
+        head_files = self._resolve_tree(self._get_current_commit_id())
+
+        # Validate every path up front so errors are reported in input order,
+        # then hash and store the files concurrently; results come back in
+        # the same order and are recorded and printed as they arrive.
+        targets = [target for target in map(self._resolve_repo_file, file_paths) if target is not None]
+        jobs = [(path, staging.get(rel), head_files.get(rel)) for path, rel in targets]
+        added = []
+        with ThreadPoolExecutor(max_workers=min(_WORKER_THREADS, len(jobs) or 1)) as pool:
+            for (path, rel), entry in zip(targets, pool.map(lambda job: self._stage_entry(*job), jobs)):
+                if entry is None:
+                    self.console.print(f"[red]ERROR: Could not read file:[/red] [yellow]{path}[/yellow]")
+                    continue
+                staging[rel] = entry
+                added.append(rel)
+                self._print(f"[green]Added:[/green] [cyan]{rel}[/cyan] [dim]({_format_size(entry['size'])})[/dim]")
+
+        # The staging log only grows until the next commit; rewrite it once
+        # re-adds of the same paths make up most of its records.
+        if len(records) + len(added) > 2 * len(staging) + _STAGING_COMPACT_SLACK:
+            self._write_staging(staging)
+        elif added:
+            self._append_jsonl(self.staging_file, [dict(staging[path], path=path) for path in added])
+        return len(added) == len(file_paths)
+
+    def _resolve_repo_file(self, file_path: str) -> Optional[Tuple[Path, str]]:
+        """Resolve a path to add to (path, relative path), or print an error and return None"""
         file_path = Path(file_path).resolve()  # Convert to absolute path
         if not file_path.exists():
             self.console.print(f"[red]ERROR: File not found:[/red] [yellow]{file_path}[/yellow]")
-            return False
+            return None
 
         if not file_path.is_file():
             self.console.print(f"[red]ERROR: Not a file:[/red] [yellow]{file_path}[/yellow]")
-            return False
+            return None
 
         # Check if file is within repository
         try:
             relative_path = file_path.relative_to(self.repo_path)
         except ValueError:
             self.console.print(f"[red]ERROR: File not in repository:[/red] [yellow]{file_path}[/yellow]")
-            return False
+            return None
 
-        # Calculate file hash and store
-        file_hash = self._calculate_file_hash(file_path)
-        self._store_object(file_hash, file_path.read_bytes())
+        return file_path, str(relative_path)
 
-        # Add to staging
-        staging = self._read_json(self.staging_file)
-        staging[str(relative_path)] = {
+    def _stage_entry(self, file_path: Path, *recorded: Optional[Dict]) -> Optional[Dict]:
+        """Build the staging entry for a file, storing its content if needed, or None if it can't be read"""
+        try:
+            st = file_path.stat()
+            file_hash = self._cached_hash(st, *recorded)
+            if file_hash is None:
+                file_hash = self._hash_and_store(file_path)
+        except OSError:
+            return None
+
+        entry = {
             "hash": file_hash,
-            "size": file_path.stat().st_size,
-            "modified": file_path.stat().st_mtime
+            "size": st.st_size,
+            "modified": st.st_mtime
         }
-        self._write_json(self.staging_file, staging)
-
-        # Format file size
-        size_kb = file_path.stat().st_size / 1024
-        size_str = f"{size_kb:.1f}KB" if size_kb < 1024 else f"{size_kb/1024:.1f}MB"
+        # A file modified this recently can still change within the same
+        # timestamp tick, so its stat data must not vouch for the hash later
+        if time.time() - st.st_mtime < _RACY_WINDOW:
+            entry["racy"] = True
+        return entry
+
+    def _settle_racy_entry(self, relative_path: str, entry: Dict) -> Dict:
+        """Drop a staging entry's racy flag, keeping its mtime only if the file still matches"""
+        entry = {key: value for key, value in entry.items() if key != "racy"}
+        file_path = self.repo_path / relative_path
+        try:
+            unchanged = file_path.stat().st_mtime == entry["modified"]
+        except OSError:
+            unchanged = False
+        if not (unchanged and self._has_content(file_path, entry)):
+            # Stat data that no longer matches must never vouch for the hash
+            entry["modified"] = None
+        return entry
 
-        self.console.print(f"[green]Added:[/green] [cyan]{relative_path}[/cyan] [dim]({size_str})[/dim]")
-        return True
-    
     def commit(self, message: Optional[str] = None) -> bool:
         """Commit staged changes"""
         if not self._check_repo():
             return False
 
-        staging = self._read_json(self.staging_file)
+        staging = self._read_staging()
         if not staging:
             self.console.print("[yellow]WARNING: No changes staged for commit[/yellow]")
             self.console.print("[dim]Tip: Use 'svcs add <file>' to stage files[/dim]")
             return False
 
+        # Record only the staged files that differ from the parent's tree
+        parent_id = self._get_current_commit_id()
+        parent_tree = self._resolve_tree(parent_id)
+        changes = {path: info for path, info in staging.items()
+                   if parent_tree.get(path, {}).get("hash") != info["hash"]}
+        if not changes:
+            self._write_staging({})
+            self.console.print("[yellow]WARNING: Staged files are unchanged since the current commit[/yellow]")
+            return False
+
+        # Rehash racily staged files once, so that commits never carry the flag
+        # and later adds can trust their stat data again
+        for path, info in changes.items():
+            if info.get("racy"):
+                changes[path] = self._settle_racy_entry(path, info)
+
         # Create commit object
+        timestamp = time.time()
         commit = {
-            "id": len(self._read_json(self.commits_file)) + 1,
-            "message": message or f"Commit at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "timestamp": time.time(),
-            "files": staging.copy(),
-            "parent": self._get_current_commit_id()
+            "id": len(self._load_commits()) + 1,
+            "message": message or f"Commit at {_format_timestamp(timestamp)}",
+            "timestamp": timestamp,
+            "files": changes,
+            "parent": parent_id
         }
+        # Count the deltas back to the nearest stored tree along this commit's
+        # own ancestry, since after a revert its parent needn't be the latest
+        deltas = 1
+        current_id = parent_id
+        while current_id is not None and deltas < _TREE_INTERVAL:
+            ancestor = self._get_commit_by_id(current_id)
+            if ancestor is None or "tree" in ancestor:
+                break
+            deltas += 1
+            current_id = self._parents.get(current_id)
+        if deltas >= _TREE_INTERVAL:
+            commit["tree"] = {**parent_tree, **changes}
 
         # Save commit
-        commits = self._read_json(self.commits_file)
-        commits.append(commit)
-        self._write_json(self.commits_file, commits)
+        self._append_commit(commit)
 
         # Update HEAD
         self.head_file.write_text(str(commit["id"]))
 
         # Clear staging
-        self._write_json(self.staging_file, {})
+        self._write_staging({})
+
+        if self.quiet:
+            return True
 
         # Create summary panel
-        files_list = "\n".join([f"  - [cyan]{f}[/cyan]" for f in list(staging.keys())[:5]])
-        if len(staging) > 5:
-            files_list += f"\n  [dim]... and {len(staging) - 5} more file(s)[/dim]"
+        files_list = "\n".join([f"  - [cyan]{f}[/cyan]" for f in list(changes.keys())[:5]])
+        if len(changes) > 5:
+            files_list += f"\n  [dim]... and {len(changes) - 5} more file(s)[/dim]"
 
         panel = Panel(
             f"[bold green]Commit #{commit['id']}[/bold green]\n\n"
             f"[bold]Message:[/bold] {commit['message']}\n"
-            f"[bold]Files:[/bold] {len(staging)} file(s)\n\n"
+            f"[bold]Files:[/bold] {len(changes)} file(s)\n\n"
             f"{files_list}",
             title="[bold green]Commit Successful[/bold green]",
             border_style="green",
@@ -197,7 +416,7 @@ class SimpleVCS:
         if not self._check_repo():
             return False
 
-        commits = self._read_json(self.commits_file)
+        commits = self._load_commits()
         if not commits:
             self.console.print("[yellow]WARNING: No commits found[/yellow]")
             return False
@@ -217,6 +436,26 @@ class SimpleVCS:
             self.console.print("[red]ERROR: Invalid commit IDs[/red]")
             return False
 
+        files1 = self._resolve_tree(commit1["id"])
+        files2 = self._resolve_tree(commit2["id"])
+
+        # Classify files with set operations, then build every row up front
+        new_files = sorted(files2.keys() - files1.keys())
+        deleted_files = sorted(files1.keys() - files2.keys())
+        modified_files = sorted(f for f in files1.keys() & files2.keys() if files1[f]["hash"] != files2[f]["hash"])
+
+        if not (new_files or deleted_files or modified_files):
+            self.console.print("[dim]No differences found between commits[/dim]")
+            return True
+
+        size_changes = [files2[f]["size"] - files1[f]["size"] for f in modified_files]
+        rows = (
+            [("[green]+ Added[/green]", f, f"Size: {_format_size(files2[f]['size'])}") for f in new_files]
+            + [("[red]- Deleted[/red]", f, "") for f in deleted_files]
+            + [("[yellow]M Modified[/yellow]", f, f"Size change: {'+' if diff > 0 else ''}{_format_size(diff)}")
+               for f, diff in zip(modified_files, size_changes)]
+        )
+
         # Create comparison table
         table = Table(
             title=f"[bold]Differences: Commit #{commit1['id']} to Commit #{commit2['id']}[/bold]",
@@ -227,46 +466,13 @@ class SimpleVCS:
         table.add_column("Status", style="bold", width=10)
         table.add_column("File", style="cyan")
         table.add_column("Details", style="dim")
+        for row in rows:
+            table.add_row(*row)
 
-        files1 = set(commit1["files"].keys())
-        files2 = set(commit2["files"].keys())
-
-        has_changes = False
-
-        # New files
-        new_files = sorted(files2 - files1)
-        for file in new_files:
-            size = commit2["files"][file]["size"]
-            size_str = f"{size/1024:.1f}KB" if size < 1024*1024 else f"{size/(1024*1024):.1f}MB"
-            table.add_row("[green]+ Added[/green]", file, f"Size: {size_str}")
-            has_changes = True
-
-        # Deleted files
-        deleted_files = sorted(files1 - files2)
-        for file in deleted_files:
-            table.add_row("[red]- Deleted[/red]", file, "")
-            has_changes = True
-
-        # Modified files
-        common_files = files1 & files2
-        modified_files = []
-        for file in sorted(common_files):
-            if commit1["files"][file]["hash"] != commit2["files"][file]["hash"]:
-                size1 = commit1["files"][file]["size"]
-                size2 = commit2["files"][file]["size"]
-                diff = size2 - size1
-                diff_str = f"+{diff/1024:.1f}KB" if diff > 0 else f"{diff/1024:.1f}KB"
-                table.add_row("[yellow]M Modified[/yellow]", file, f"Size change: {diff_str}")
-                modified_files.append(file)
-                has_changes = True
-
-        if not has_changes:
-            self.console.print("[dim]No differences found between commits[/dim]")
-        else:
-            self.console.print(table)
-            self.console.print(f"\n[dim]Summary: [green]{len(new_files)} added[/green], "
-                             f"[yellow]{len(modified_files)} modified[/yellow], "
-                             f"[red]{len(deleted_files)} deleted[/red][/dim]")
+        self.console.print(table)
+        self.console.print(f"\n[dim]Summary: [green]{len(new_files)} added[/green], "
+                         f"[yellow]{len(modified_files)} modified[/yellow], "
+                         f"[red]{len(deleted_files)} deleted[/red][/dim]")
 
         return True
     
@@ -275,7 +481,7 @@ class SimpleVCS:
         if not self._check_repo():
             return False
 
-        commits = self._read_json(self.commits_file)
+        commits = self._load_commits()
         if not commits:
             # Create empty state panel
             empty_panel = Panel(
@@ -295,7 +501,7 @@ class SimpleVCS:
             return False
 
         commits_to_show = commits[-limit:] if limit else commits
-        commits_to_show.reverse()  # Show newest first
+        commits_to_show = commits_to_show[::-1]  # Show newest first
 
         # Print beautiful header
         self.console.print()
@@ -328,7 +534,7 @@ class SimpleVCS:
             if is_current:
                 commit_id = f"-> {commit_id}"  # Mark current commit with arrow
 
-            date_str = datetime.fromtimestamp(commit['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+            date_str = _format_timestamp(commit['timestamp'])
             message = commit['message']
             if len(message) > 60:
                 message = message[:57] + "..."
@@ -381,9 +587,9 @@ class SimpleVCS:
         if not self._check_repo():
             return False
 
-        staging = self._read_json(self.staging_file)
+        staging = self._read_staging()
         current_commit = self._get_current_commit()
-        total_commits = len(self._read_json(self.commits_file))
+        total_commits = len(self._load_commits())
 
         # Create status panel
         status_text = f"[bold]Repository:[/bold] [cyan]{self.repo_path.name}[/cyan]\n"
@@ -414,8 +620,7 @@ class SimpleVCS:
             table.add_column("Hash", style="dim", width=16)
 
             for file, info in staging.items():
-                size = info['size']
-                size_str = f"{size/1024:.1f}KB" if size < 1024*1024 else f"{size/(1024*1024):.1f}MB"
+                size_str = _format_size(info['size'])
                 hash_short = info['hash'][:14] + "..."
                 table.add_row(file, size_str, hash_short)
 
@@ -436,30 +641,192 @@ class SimpleVCS:
             return False
         return True
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file"""
-        hasher = hashlib.sha256()
+    def _calculate_file_hash(self, file_path: Path, algorithm: Optional[str] = None) -> str:
+        """Calculate the content hash of a file, by default with the repository's algorithm"""
+        if (algorithm or self._get_hash_algorithm()) == "blake3":
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return _BLAKE3_PREFIX + hasher.hexdigest()
+
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            hasher = hashlib.sha256()
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size <= _MMAP_HASH_LIMIT:
+                # Hash the whole file in a single update from the page cache
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            else:
+                for chunk in _iter_chunks(f):
+                    hasher.update(chunk)
         return hasher.hexdigest()
     
-    def _store_object(self, obj_hash: str, content: bytes):
-        """Store object in objects directory"""
-        obj_path = self.objects_dir / obj_hash
-        if not obj_path.exists():
-            obj_path.write_bytes(content)
+    def _cached_hash(self, st: os.stat_result, *entries: Optional[Dict]) -> Optional[str]:
+        """Return a recorded hash if the file's size and mtime still match it"""
+        # Whole-second mtimes could hide a same-size rewrite, so always rehash those
+        if st.st_mtime_ns % 1_000_000_000 == 0:
+            return None
+        for entry in entries:
+            if (entry and not entry.get("racy") and entry["size"] == st.st_size and entry["modified"] == st.st_mtime
+                    and self._find_object(entry["hash"]) is not None):
+                return entry["hash"]
+        return None
+
+    def _hash_and_store(self, file_path: Path) -> str:
+        """Hash a file and store it in objects directory unless it is already there"""
+        algorithm = self._get_hash_algorithm()
+        # Files that fit in the page cache are hashed first and only copied if
+        # their object is missing; larger ones are copied while being hashed
+        if file_path.stat().st_size <= _MMAP_HASH_LIMIT:
+            obj_hash = self._calculate_file_hash(file_path, algorithm)
+            if self._find_object(obj_hash) is not None:
+                return obj_hash
+
+        hasher, prefix = _new_hasher(algorithm)
+        fd, tmp_name = _create_temp(self.objects_dir)
+        try:
+            with open(file_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                for chunk in _iter_chunks(src):
+                    hasher.update(chunk)
+                    dst.write(chunk)
+            obj_hash = prefix + hasher.hexdigest()
+            if self._find_object(obj_hash) is None:
+                os.replace(tmp_name, self.objects_dir / obj_hash)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        return obj_hash
     
+    def _find_object(self, obj_hash: str) -> Optional[Path]:
+        """Return the stored path of an object, plain or gzipped, if it exists"""
+        obj_path = self.objects_dir / obj_hash
+        if obj_path.exists():
+            return obj_path
+        compressed_path = obj_path.with_name(obj_hash + _GZIP_SUFFIX)
+        if compressed_path.exists():
+            return compressed_path
+        return None
+
+    def _restore_file(self, target_path: Path, file_info: Dict):
+        """Restore one committed file from the object store unless it is already up to date"""
+        obj_path = self._find_object(file_info["hash"])
+        if obj_path is None or self._has_content(target_path, file_info):
+            return
+
+        # Create parent directories if they don't exist
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if obj_path.suffix == _GZIP_SUFFIX:
+            with gzip.open(obj_path, 'rb') as f_in, open(target_path, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, _HASH_CHUNK_SIZE)
+        else:
+            _copy_file(obj_path, target_path)
+
+    def _has_content(self, file_path: Path, file_info: Dict) -> bool:
+        """Check whether a file already matches a recorded size and hash"""
+        algorithm = _hash_algorithm_of(file_info["hash"])
+        if algorithm == "blake3" and blake3 is None:
+            return False
+        try:
+            if not file_path.is_file() or file_path.stat().st_size != file_info["size"]:
+                return False
+        except OSError:
+            return False
+        return self._calculate_file_hash(file_path, algorithm) == file_info["hash"]
+
     def _read_json(self, file_path: Path) -> Dict:
         """Read JSON file"""
         if not file_path.exists():
             return {}
-        return json.loads(file_path.read_text())
-    
-    def _write_json(self, file_path: Path, data: Dict):
-        """Write JSON file"""
-        file_path.write_text(json.dumps(data, indent=2))
+        return _json_loads(file_path.read_bytes())
     
+    def _read_jsonl(self, file_path: Path) -> List[Dict]:
+        """Read newline-delimited JSON file, ignoring a torn final line"""
+        if not file_path.exists():
+            return []
+        data = file_path.read_bytes()
+        # Only newline-terminated lines are complete; text after the last
+        # newline is left by an interrupted append
+        return [_json_loads(line) for line in data[:data.rfind(b"\n") + 1].splitlines() if line.strip()]
+
+    def _append_jsonl(self, file_path: Path, records: List[Dict]):
+        """Append records to newline-delimited JSON file, dropping a torn final line"""
+        with open(file_path, 'a+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.seek(0)
+                    f.truncate(f.read().rfind(b"\n") + 1)
+            f.write(b"".join(_json_dumps(record) + b"\n" for record in records))
+
+    def _read_staging_records(self) -> List[Dict]:
+        """Read the raw staging log, migrating a staging.json from older versions"""
+        if not self.staging_file.exists() and self.legacy_staging_file.exists():
+            self._write_staging(self._read_json(self.legacy_staging_file))
+            self.legacy_staging_file.unlink()
+        return self._read_jsonl(self.staging_file)
+
+    def _read_staging(self) -> Dict:
+        """Read staged files as {path: {hash, size, modified}}"""
+        return _fold_staging(self._read_staging_records())
+
+    def _write_staging(self, staging: Dict):
+        """Replace the staging log with one record per staged file"""
+        tmp_file = self.staging_file.with_name(self.staging_file.name + ".tmp")
+        tmp_file.write_bytes(b"".join(_json_dumps(dict(info, path=path)) + b"\n"
+                                      for path, info in staging.items()))
+        os.replace(tmp_file, self.staging_file)
+
+    def _load_commits(self) -> List[Dict]:
+        """Read the commit log, reusing the parsed list while the file is unchanged"""
+        try:
+            st = self.commits_file.stat()
+        except FileNotFoundError:
+            if not self.legacy_commits_file.exists():
+                return []
+            self._migrate_legacy_commits()
+            st = self.commits_file.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if self._commits_cache is None or key != self._commits_cache_key:
+            self._cache_commits(self._read_jsonl(self.commits_file), key)
+        return self._commits_cache
+
+    def _append_commit(self, commit: Dict):
+        """Append one commit to the log and keep the cache in step with it"""
+        commits = self._load_commits()
+        self._append_jsonl(self.commits_file, [commit])
+        st = self.commits_file.stat()
+        self._cache_commits(commits + [commit], (st.st_mtime_ns, st.st_size))
+
+    def _migrate_legacy_commits(self):
+        """Convert a commits.json array from older versions into commits.jsonl"""
+        commits = self._read_json(self.legacy_commits_file)
+        tmp_file = self.commits_file.with_name(self.commits_file.name + ".tmp")
+        tmp_file.write_bytes(b"".join(_json_dumps(commit) + b"\n" for commit in commits))
+        os.replace(tmp_file, self.commits_file)
+        self.legacy_commits_file.unlink()
+
+    def _cache_commits(self, commits: List[Dict], key: Tuple[int, int]):
+        """Remember a parsed commit list and index it by ID and parent links"""
+        self._commits_cache = commits
+        self._commits_cache_key = key
+        self._commits_by_id = {commit["id"]: commit for commit in commits}
+        self._parents = {commit["id"]: commit.get("parent") for commit in commits}
+        self._children = {}
+        for commit_id, parent_id in self._parents.items():
+            if parent_id is not None:
+                self._children.setdefault(parent_id, []).append(commit_id)
+        self._trees = {}
+
+    def _get_hash_algorithm(self) -> str:
+        """Get the repository's hash algorithm, SHA-256 for repositories without a config"""
+        if self._hash_algorithm is None:
+            self._hash_algorithm = self._read_json(self.config_file).get("hash", "sha256")
+        return self._hash_algorithm
+
     def _get_current_commit_id(self) -> Optional[int]:
         """Get current commit ID"""
         if not self.head_file.exists():
@@ -479,11 +846,50 @@ class SimpleVCS:
     
     def _get_commit_by_id(self, commit_id: int) -> Optional[Dict]:
         """Get commit by ID"""
-        commits = self._read_json(self.commits_file)
-        for commit in commits:
-            if commit["id"] == commit_id:
-                return commit
-        return None
+        self._load_commits()
+        return self._commits_by_id.get(commit_id)
+
+    def _ancestors(self, commit_id: int):
+        """Yield the IDs of a commit's ancestors, nearest first"""
+        self._load_commits()
+        current_id = self._parents.get(commit_id)
+        while current_id is not None:
+            yield current_id
+            current_id = self._parents.get(current_id)
+
+    def _is_ancestor(self, ancestor_id: int, commit_id: int) -> bool:
+        """Check whether ancestor_id is reachable from commit_id through parents"""
+        return any(current_id == ancestor_id for current_id in self._ancestors(commit_id))
+
+    def _resolve_tree(self, commit_id: Optional[int]) -> Dict:
+        """Return the full {path: info} tree of a commit, memoized and not to be modified"""
+        if commit_id is None:
+            return {}
+        self._load_commits()
+        if commit_id in self._trees:
+            return self._trees[commit_id]
+
+        chain = []
+        base = {}
+        current_id = commit_id
+        while current_id is not None:
+            if current_id in self._trees:
+                base = self._trees[current_id]
+                break
+            commit = self._commits_by_id.get(current_id)
+            if commit is None:
+                break
+            if "tree" in commit:
+                base = commit["tree"]
+                break
+            chain.append(commit)
+            current_id = self._parents.get(current_id)
+
+        tree = dict(base)
+        for commit in reversed(chain):
+            tree.update(commit["files"])
+        self._trees[commit_id] = tree
+        return tree
 
     def quick_revert(self, commit_id: int) -> bool:
         """Quickly revert to a specific commit"""
@@ -495,28 +901,25 @@ class SimpleVCS:
             self.console.print(f"[red]ERROR: Commit #{commit_id} not found[/red]")
             return False
 
-        self.console.print(f"[cyan]Reverting to commit #{commit_id}...[/cyan]")
-
-        # Restore files from the specified commit
-        for file_path, file_info in commit["files"].items():
-            target_path = self.repo_path / file_path
-            obj_path = self.objects_dir / file_info["hash"]
+        self._print(f"[cyan]Reverting to commit #{commit_id}...[/cyan]")
 
-            # Create parent directories if they don't exist
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file from objects to target location
-            if obj_path.exists():
-                shutil.copy2(obj_path, target_path)
+        # Restore files from the specified commit. The copies are independent
+        # and I/O-bound, so they run concurrently; list() re-raises any error.
+        files = self._resolve_tree(commit_id)
+        with ThreadPoolExecutor(max_workers=min(_WORKER_THREADS, len(files) or 1)) as pool:
+            list(pool.map(self._restore_file, (self.repo_path / path for path in files), files.values()))
 
         # Update HEAD to point to the reverted commit
         self.head_file.write_text(str(commit_id))
 
+        if self.quiet:
+            return True
+
         panel = Panel(
             f"[bold green]Successfully reverted to commit #{commit_id}[/bold green]\n\n"
             f"[bold]Message:[/bold] {commit['message']}\n"
-            f"[bold]Files restored:[/bold] {len(commit['files'])}\n"
-            f"[bold]Date:[/bold] {datetime.fromtimestamp(commit['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}",
+            f"[bold]Files restored:[/bold] {len(files)}\n"
+            f"[bold]Date:[/bold] {_format_timestamp(commit['timestamp'])}",
             title="[bold green]Revert Complete[/bold green]",
             border_style="green",
             box=box.ROUNDED
@@ -532,28 +935,20 @@ class SimpleVCS:
         snapshot_name = name or f"snapshot_{int(time.time())}"
         snapshot_path = self.repo_path / f"{snapshot_name}.zip"
 
-        self.console.print("[cyan]Creating snapshot...[/cyan]")
+        self._print("[cyan]Creating snapshot...[/cyan]")
 
-        # Count files first
+        # Level 1 deflate is several times faster than the default level 6
+        # for only slightly larger archives
         file_count = 0
-        for root, dirs, files in os.walk(self.repo_path):
-            dirs[:] = [d for d in dirs if d != '.svcs']
-            file_count += len(files)
-
-        # Create a zip archive of all tracked files
-        with zipfile.ZipFile(snapshot_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(self.repo_path):
-                # Skip .svcs directory
-                dirs[:] = [d for d in dirs if d != '.svcs']
+        with zipfile.ZipFile(snapshot_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            for file_path, arc_path in self._iter_repo_files(exclude=snapshot_path):
+                zipf.write(file_path, arc_path)
+                file_count += 1
 
-                for file in files:
-                    file_path = Path(root) / file
-                    if file_path != snapshot_path:  # Don't include the snapshot itself
-                        arc_path = file_path.relative_to(self.repo_path)
-                        zipf.write(file_path, arc_path)
+        if self.quiet:
+            return True
 
-        snapshot_size = snapshot_path.stat().st_size
-        size_str = f"{snapshot_size/1024:.1f}KB" if snapshot_size < 1024*1024 else f"{snapshot_size/(1024*1024):.1f}MB"
+        size_str = _format_size(snapshot_path.stat().st_size)
 
         panel = Panel(
             f"[bold green]Snapshot created successfully[/bold green]\n\n"
@@ -568,6 +963,20 @@ class SimpleVCS:
         self.console.print(panel)
         return True
 
+    def _iter_repo_files(self, exclude: Optional[Path] = None):
+        """Yield (path, archive name) for the working files, skipping .svcs"""
+        exclude = str(exclude) if exclude else None
+        pending = [(str(self.repo_path), "")]
+        while pending:
+            dir_path, arc_prefix = pending.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '.svcs':
+                            pending.append((entry.path, arc_prefix + entry.name + "/"))
+                    elif entry.is_file() and entry.path != exclude:
+                        yield entry.path, arc_prefix + entry.name
+
     def restore_from_snapshot(self, snapshot_path: str) -> bool:
         """Restore repository from a snapshot"""
         snapshot_path = Path(snapshot_path)
@@ -575,7 +984,7 @@ class SimpleVCS:
             self.console.print(f"[red]ERROR: Snapshot not found:[/red] [yellow]{snapshot_path}[/yellow]")
             return False
 
-        self.console.print("[cyan]Restoring from snapshot...[/cyan]")
+        self._print("[cyan]Restoring from snapshot...[/cyan]")
 
         # Extract the zip archive
         with zipfile.ZipFile(snapshot_path, 'r') as zipf:
@@ -592,6 +1001,9 @@ class SimpleVCS:
             # Extract all files
             zipf.extractall(self.repo_path)
 
+        if self.quiet:
+            return True
+
         panel = Panel(
             f"[bold green]Repository restored successfully[/bold green]\n\n"
             f"[bold]Snapshot:[/bold] [cyan]{snapshot_path.name}[/cyan]\n"
@@ -608,50 +1020,56 @@ class SimpleVCS:
         if not self._check_repo():
             return False
 
-        original_size = sum(f.stat().st_size for f in self.objects_dir.glob('*') if f.is_file())
-        obj_files = [f for f in self.objects_dir.glob('*') if f.is_file() and f.stat().st_size > 1024]
+        object_sizes = {f: f.stat().st_size for f in self._object_files()}
+        original_size = sum(object_sizes.values())
+        obj_files = [f for f, size in object_sizes.items() if f.suffix != _GZIP_SUFFIX and size > 1024]
 
         if not obj_files:
-            self.console.print("[yellow]WARNING: No objects to compress (files are too small)[/yellow]")
+            self.console.print("[yellow]WARNING: No objects to compress (files are too small or already compressed)[/yellow]")
             return True
 
-        self.console.print("[cyan]Compressing objects...[/cyan]")
+        self._print("[cyan]Compressing objects...[/cyan]")
 
-        # For each object file, compress it if it's large enough to benefit
-        for obj_file in obj_files:
-            # Create a compressed version with .gz extension
-            compressed_path = obj_file.with_suffix(obj_file.suffix + '.gz')
-            with open(obj_file, 'rb') as f_in:
-                import gzip
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    f_out.writelines(f_in)
+        # zlib releases the GIL while compressing, so objects compress in parallel
+        with ThreadPoolExecutor(max_workers=min(_WORKER_THREADS, len(obj_files))) as pool:
+            compressed_count = sum(pool.map(self._compress_object, obj_files))
 
-            # Replace original with compressed version
-            obj_file.unlink()
-            # Decompress back to original name for compatibility
-            with gzip.open(compressed_path, 'rb') as f_in:
-                with open(obj_file, 'wb') as f_out:
-                    f_out.write(f_in.read())
-            compressed_path.unlink()
+        if self.quiet:
+            return True
 
-        new_size = sum(f.stat().st_size for f in self.objects_dir.glob('*') if f.is_file())
+        new_size = sum(f.stat().st_size for f in self._object_files())
         saved_space = original_size - new_size
         saved_percent = (saved_space / original_size * 100) if original_size > 0 else 0
 
-        # Format sizes
-        orig_str = f"{original_size/1024:.1f}KB" if original_size < 1024*1024 else f"{original_size/(1024*1024):.1f}MB"
-        new_str = f"{new_size/1024:.1f}KB" if new_size < 1024*1024 else f"{new_size/(1024*1024):.1f}MB"
-        saved_str = f"{saved_space/1024:.1f}KB" if saved_space < 1024*1024 else f"{saved_space/(1024*1024):.1f}MB"
-
         panel = Panel(
             f"[bold green]Compression completed successfully[/bold green]\n\n"
-            f"[bold]Original size:[/bold] {orig_str}\n"
-            f"[bold]New size:[/bold] {new_str}\n"
-            f"[bold]Space saved:[/bold] [green]{saved_str}[/green] [dim]({saved_percent:.1f}%)[/dim]\n"
-            f"[bold]Objects compressed:[/bold] {len(obj_files)}",
+            f"[bold]Original size:[/bold] {_format_size(original_size)}\n"
+            f"[bold]New size:[/bold] {_format_size(new_size)}\n"
+            f"[bold]Space saved:[/bold] [green]{_format_size(saved_space)}[/green] [dim]({saved_percent:.1f}%)[/dim]\n"
+            f"[bold]Objects compressed:[/bold] {compressed_count}",
             title="[bold green]Compression Complete[/bold green]",
             border_style="green",
             box=box.ROUNDED
         )
         self.console.print(panel)
         return True
+
+    def _object_files(self) -> List[Path]:
+        """List stored object files, skipping in-progress temporary files"""
+        return [f for f in self.objects_dir.iterdir() if f.is_file() and not f.name.startswith('.')]
+
+    def _compress_object(self, obj_file: Path) -> bool:
+        """Gzip a stored object if that makes it smaller, returning whether it did"""
+        fd, tmp_name = _create_temp(self.objects_dir)
+        try:
+            with open(obj_file, 'rb') as f_in, os.fdopen(fd, 'wb') as raw_out:
+                with gzip.GzipFile(fileobj=raw_out, mode='wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out, _HASH_CHUNK_SIZE)
+            if os.path.getsize(tmp_name) >= obj_file.stat().st_size:
+                return False
+            os.replace(tmp_name, obj_file.with_name(obj_file.name + _GZIP_SUFFIX))
+            obj_file.unlink()
+            return True
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
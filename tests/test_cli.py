@@ -0,0 +1,52 @@
+import io
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from simple_vcs import cli
+from simple_vcs._render_help import HELP_WIDTH, render_help
+from simple_vcs.core import SimpleVCS
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(cli.main, ["init"]).exit_code == 0
+    return runner
+
+
+def test_prerendered_help_is_up_to_date():
+    out = io.StringIO()
+    render_help(Console(file=out, width=HELP_WIDTH, force_terminal=True, color_system="standard"))
+    assert out.getvalue() == cli._PRERENDERED_HELP.read_text(encoding="utf-8")
+
+
+def test_main_help():
+    result = CliRunner().invoke(cli.main, ["--help"])
+    assert result.exit_code == 0, result.output
+    assert "SimpleVCS" in result.output
+
+
+@pytest.mark.parametrize("name", sorted(cli._COMMAND_SPECS))
+def test_subcommand_help(name):
+    result = CliRunner().invoke(cli.main, [name, "--help"])
+    assert result.exit_code == 0, result.output
+    assert f"Usage: main {name}" in result.output
+
+
+def test_add(runner):
+    Path("a.txt").write_text("a")
+    result = runner.invoke(cli.main, ["add", "a.txt"])
+    assert result.exit_code == 0, result.output
+    assert "Added:" in result.output
+
+
+def test_quiet_add(runner):
+    Path("a.txt").write_text("a")
+    result = runner.invoke(cli.main, ["-q", "add", "a.txt"])
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert list(SimpleVCS(".")._read_staging()) == ["a.txt"]
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from simple_vcs import core
+from simple_vcs.core import SimpleVCS, _TREE_INTERVAL
+
+TEST_PROJECT = Path(__file__).resolve().parent.parent / "test_project"
+
+
+@pytest.fixture
+def legacy_repo(tmp_path):
+    """Copy of test_project, whose .svcs still uses commits.json and staging.json"""
+    repo_path = tmp_path / "legacy"
+    shutil.copytree(TEST_PROJECT, repo_path)
+    return repo_path
+
+
+@pytest.fixture
+def vcs(tmp_path):
+    repo = SimpleVCS(tmp_path, quiet=True)
+    assert repo.init_repo()
+    return repo
+
+
+def commit_files(vcs, message, **contents):
+    """Write the given files, stage them and commit"""
+    for name, content in contents.items():
+        (vcs.repo_path / name).write_text(content)
+    assert vcs.add_files([str(vcs.repo_path / name) for name in contents])
+    assert vcs.commit(message)
+    return vcs._get_current_commit_id()
+
+
+def test_legacy_commits_json_is_migrated(legacy_repo):
+    vcs = SimpleVCS(legacy_repo, quiet=True)
+    legacy_commits = json.loads((legacy_repo / ".svcs" / "commits.json").read_text())
+
+    assert vcs._load_commits() == legacy_commits
+    assert not vcs.legacy_commits_file.exists()
+    assert vcs.commits_file.exists()
+    assert SimpleVCS(legacy_repo, quiet=True)._load_commits() == legacy_commits
+
+
+def test_legacy_staging_json_is_migrated(legacy_repo):
+    entry = {"hash": "0" * 64, "size": 1, "modified": 1.5}
+    (legacy_repo / ".svcs" / "staging.json").write_text(json.dumps({"hello.txt": entry}))
+    vcs = SimpleVCS(legacy_repo, quiet=True)
+
+    assert vcs._read_staging() == {"hello.txt": entry}
+    assert not vcs.legacy_staging_file.exists()
+    assert vcs.staging_file.exists()
+
+
+def test_legacy_repo_commits_with_sha256(legacy_repo):
+    vcs = SimpleVCS(legacy_repo, quiet=True)
+    assert vcs._get_hash_algorithm() == "sha256"
+
+    # Re-adding the unchanged file gives the same object, so nothing to commit
+    (legacy_repo / "hello.txt").touch()
+    assert vcs.add_files([str(legacy_repo / "hello.txt")])
+    assert not vcs.commit("unchanged")
+
+    commit_id = commit_files(vcs, "Change hello", **{"hello.txt": "Hello again, with new content\n"})
+    tree = vcs._resolve_tree(commit_id)
+    expected = hashlib.sha256(b"Hello again, with new content\n").hexdigest()
+    assert tree["hello.txt"]["hash"] == expected
+    assert vcs._get_commit_by_id(commit_id)["parent"] == 1
+
+
+def count_hashes(monkeypatch, vcs):
+    """Record the files that add_files hashes and stores"""
+    hashed = []
+    hash_and_store = vcs._hash_and_store
+
+    def spy(file_path):
+        hashed.append(file_path.name)
+        return hash_and_store(file_path)
+
+    monkeypatch.setattr(vcs, "_hash_and_store", spy)
+    return hashed
+
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_stat_cache_skips_unchanged_files(vcs, monkeypatch):
+    # Written, added and committed at once, so the file is racy when staged
+    commit_id = commit_files(vcs, "Initial", **{"a.txt": "a"})
+    assert "racy" not in vcs._get_commit_by_id(commit_id)["files"]["a.txt"]
+
+    hashed = count_hashes(monkeypatch, vcs)
+    assert vcs.add_files([str(vcs.repo_path / "a.txt")])
+    assert hashed == []
+
+
+def test_stat_cache_rehashes_same_size_rewrite(vcs, monkeypatch):
+    path = vcs.repo_path / "a.txt"
+    old_ns = (int(time.time()) - 10) * 1_000_000_000
+    path.write_text("one")
+    set_mtime(path, old_ns + 250_000_000)
+    assert vcs.add_files([str(path)])
+    assert vcs.commit("Initial")
+
+    hashed = count_hashes(monkeypatch, vcs)
+    path.write_text("two")
+    set_mtime(path, old_ns + 750_000_000)
+    assert vcs.add_files([str(path)])
+    assert hashed == ["a.txt"]
+    assert vcs.commit("Rewrite")
+
+
+def test_stat_cache_rehashes_whole_second_mtimes(vcs, monkeypatch):
+    path = vcs.repo_path / "a.txt"
+    path.write_text("a")
+    set_mtime(path, (int(time.time()) - 10) * 1_000_000_000)
+    assert vcs.add_files([str(path)])
+    assert vcs.commit("Initial")
+
+    hashed = count_hashes(monkeypatch, vcs)
+    assert vcs.add_files([str(path)])
+    assert hashed == ["a.txt"]
+
+
+def test_add_files_stages_readable_files_when_one_fails(vcs, monkeypatch):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (vcs.repo_path / name).write_text(name)
+    hash_and_store = vcs._hash_and_store
+
+    def unreadable_b(file_path):
+        if file_path.name == "b.txt":
+            raise PermissionError(file_path)
+        return hash_and_store(file_path)
+
+    monkeypatch.setattr(vcs, "_hash_and_store", unreadable_b)
+    assert not vcs.add_files([str(vcs.repo_path / name) for name in ("a.txt", "b.txt", "c.txt")])
+    assert sorted(vcs._read_staging()) == ["a.txt", "c.txt"]
+
+
+def test_objects_are_stored_once_with_umask_mode(vcs, monkeypatch):
+    first = commit_files(vcs, "Initial", **{"a.txt": "a"})
+    obj_hash = vcs._resolve_tree(first)["a.txt"]["hash"]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert (vcs.objects_dir / obj_hash).stat().st_mode & 0o777 == 0o666 & ~umask
+
+    commit_files(vcs, "Second", **{"a.txt": "b"})
+    assert vcs.quick_revert(first)
+    temps = []
+    create_temp = core._create_temp
+    monkeypatch.setattr(core, "_create_temp", lambda directory: temps.append(directory) or create_temp(directory))
+    # The restored file has a fresh mtime, but its object already exists
+    assert vcs.add_files([str(vcs.repo_path / "a.txt")])
+    assert temps == []
+
+
+def test_resolve_tree_across_tree_interval(vcs):
+    names = [f"file{i}.txt" for i in range(5)]
+    commit_files(vcs, "Initial", **{name: name for name in names})
+    for n in range(2, 2 * _TREE_INTERVAL + 3):
+        commit_files(vcs, f"Commit {n}", **{names[n % len(names)]: f"version {n}"})
+
+    commits = vcs._load_commits()
+    assert [c["id"] for c in commits if "tree" in c] == [_TREE_INTERVAL, 2 * _TREE_INTERVAL]
+    assert all(len(c["files"]) == 1 for c in commits[1:])
+
+    expected = {}
+    for commit in commits:
+        expected.update(commit["files"])
+        # A fresh instance resolves without any memoized trees
+        assert SimpleVCS(vcs.repo_path, quiet=True)._resolve_tree(commit["id"]) == expected
+        assert vcs._resolve_tree(commit["id"]) == expected
+
+
+def test_tree_interval_on_alternating_branches(vcs):
+    root = commit_files(vcs, "Initial", **{"a.txt": "root"})
+    heads = [root, root]
+    for n in range(2 * _TREE_INTERVAL + 2):
+        branch = n % 2
+        assert vcs.quick_revert(heads[branch])
+        heads[branch] = commit_files(vcs, f"Branch {branch} commit {n}", **{"a.txt": f"{branch} {n}"})
+
+    # Commit IDs alternate between the branches, yet neither replays a long chain
+    for commit in vcs._load_commits():
+        chain = [commit["id"], *vcs._ancestors(commit["id"])]
+        replayed = next((i for i, commit_id in enumerate(chain)
+                         if "tree" in vcs._get_commit_by_id(commit_id)), len(chain))
+        assert replayed < _TREE_INTERVAL
+
+    for branch, head in enumerate(heads):
+        assert vcs.quick_revert(head)
+        assert (vcs.repo_path / "a.txt").read_text() == f"{branch} {2 * _TREE_INTERVAL + branch}"
+        assert SimpleVCS(vcs.repo_path, quiet=True)._resolve_tree(head) == vcs._resolve_tree(head)
+
+
+def test_resolve_tree_after_revert_then_commit(vcs):
+    first = commit_files(vcs, "Initial", **{"a.txt": "a1", "b.txt": "b1"})
+    second = commit_files(vcs, "Change a", **{"a.txt": "a2 changed"})
+    third = commit_files(vcs, "Change b", **{"b.txt": "b3 changed"})
+
+    assert vcs.quick_revert(first)
+    assert (vcs.repo_path / "a.txt").read_text() == "a1"
+    assert (vcs.repo_path / "b.txt").read_text() == "b1"
+
+    branch = commit_files(vcs, "Branch from 1", **{"a.txt": "a4 on branch"})
+    tree = vcs._resolve_tree(branch)
+    assert tree["a.txt"]["hash"] == vcs._calculate_file_hash(vcs.repo_path / "a.txt")
+    assert tree["b.txt"] == vcs._resolve_tree(first)["b.txt"]
+    assert tree["b.txt"] != vcs._resolve_tree(third)["b.txt"]
+
+    assert list(vcs._ancestors(branch)) == [first]
+    assert vcs._is_ancestor(first, branch)
+    assert not vcs._is_ancestor(second, branch)
+    assert sorted(vcs._children[first]) == [second, branch]
+
+
+def test_revert_from_gzipped_objects(vcs):
+    original = "compressible line\n" * 500
+    (vcs.repo_path / "sub").mkdir()
+    first = commit_files(vcs, "Initial", **{"big.txt": original, "sub/small.txt": "x"})
+    obj_hash = vcs._resolve_tree(first)["big.txt"]["hash"]
+
+    assert vcs.compress_objects()
+    assert not (vcs.objects_dir / obj_hash).exists()
+    assert (vcs.objects_dir / (obj_hash + ".gz")).exists()
+
+    commit_files(vcs, "Overwrite", **{"big.txt": "short"})
+    (vcs.repo_path / "sub" / "small.txt").unlink()
+
+    assert vcs.quick_revert(first)
+    assert (vcs.repo_path / "big.txt").read_text() == original
+    assert (vcs.repo_path / "sub" / "small.txt").read_text() == "x"
+
+    # Re-adding the restored file finds the compressed object instead of storing a copy
+    assert vcs.add_files([str(vcs.repo_path / "big.txt")])
+    assert not (vcs.objects_dir / obj_hash).exists()
+
+
+def test_torn_log_line_is_ignored(vcs):
+    commit_files(vcs, "Initial", **{"a.txt": "a"})
+    with open(vcs.commits_file, "ab") as f:
+        f.write(b'{"id": 2, "mess')
+
+    reopened = SimpleVCS(vcs.repo_path, quiet=True)
+    assert [c["id"] for c in reopened._load_commits()] == [1]
+    commit_files(reopened, "Second", **{"a.txt": "a second"})
+    assert [c["id"] for c in SimpleVCS(vcs.repo_path, quiet=True)._load_commits()] == [1, 2]